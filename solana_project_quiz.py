@@ -4,203 +4,216 @@ Solana Patent NFT Marketplace Quiz
 Tests knowledge of Solana program architecture, PDAs, and execution flows
 """
 
+import collections
 import random
 import sys
 
+# Question records are built once at import time so constructing a quiz
+# doesn't re-allocate the whole question bank.
+_Q = collections.namedtuple("_Q", "question options correct explanation")
+
+# Separator lines, built once instead of per question
+_HR = "─" * 70
+_BAR = "=" * 70
+
+_QUESTIONS: tuple[_Q, ...] = (
+    _Q(
+        "When minting a patent NFT, which file contains the Rust program logic?",
+        ("programs/patent-nft/src/lib.rs", "app/sdk.ts"),
+        0,
+        "programs/patent-nft/src/lib.rs:52 (mint_patent_nft) contains the on-chain program logic"
+    ),
+    _Q(
+        "What PDA seeds are used to derive the patent registry account?",
+        ("[b'state']", "[b'patent', patent_hash]"),
+        1,
+        "Patent registry uses [b'patent', patent_hash] to ensure each patent can only be minted once"
+    ),
+    _Q(
+        "Which SDK function prepares the minting transaction?",
+        ("app/sdk.ts:147 (PatentNFTSDK.mintPatentNFT)", "app/sdk.ts:330 (NFTMarketplaceSDK.listNFT)"),
+        0,
+        "PatentNFTSDK.mintPatentNFT() derives PDAs and builds the minting transaction"
+    ),
+    _Q(
+        "What is the minimum minting fee required?",
+        ("0.025 SOL", "0.05 SOL"),
+        1,
+        "programs/patent-nft/src/lib.rs:53 verifies payment >= 0.05 SOL"
+    ),
+    _Q(
+        "Which program is called via CPI to create NFT metadata?",
+        ("SPL Token Program", "Metaplex Token Metadata Program"),
+        1,
+        "Metaplex Token Metadata Program is called to create NFT metadata and master edition"
+    ),
+    _Q(
+        "When listing an NFT, where is the NFT transferred to?",
+        ("Marketplace program account", "Escrow ATA owned by listing PDA"),
+        1,
+        "NFT is transferred to an Associated Token Account owned by the listing PDA for escrow"
+    ),
+    _Q(
+        "What percentage marketplace fee is collected on sales?",
+        ("2.5%", "5%"),
+        0,
+        "programs/nft-marketplace/src/lib.rs:102 calculates 2.5% platform fee"
+    ),
+    _Q(
+        "Which instruction handles buying an NFT from the marketplace?",
+        ("programs/nft-marketplace/src/lib.rs:97 (buy_nft)", "programs/nft-marketplace/src/lib.rs:52 (list_nft)"),
+        0,
+        "buy_nft() handles the purchase, fee distribution, and NFT transfer"
+    ),
+    _Q(
+        "What is PSP in the Solana version?",
+        ("An ERC-20 token", "An SPL Token"),
+        1,
+        "PSP (Patent Search Pennies) is an SPL Token on Solana, not ERC-20"
+    ),
+    _Q(
+        "How many PSP tokens equal 1 SOL by default?",
+        ("100 PSP", "1,000 PSP"),
+        1,
+        "Default exchange rate is 1 SOL = 1,000 PSP (configurable)"
+    ),
+    _Q(
+        "Which program handles multi-token payment for searches?",
+        ("programs/search-payment/src/lib.rs", "programs/psp-token/src/lib.rs"),
+        0,
+        "search-payment program supports SOL, USDC, and PSP payments"
+    ),
+    _Q(
+        "What Anchor constraint verifies account ownership?",
+        ("#[account(signer)]", "#[account(has_one = authority)]"),
+        1,
+        "has_one constraint verifies that an account field matches the expected value"
+    ),
+    _Q(
+        "How does Solana prevent reentrancy attacks?",
+        ("nonReentrant modifier", "Explicit account passing and Rust borrow checker"),
+        1,
+        "Solana's architecture and Rust's borrow checker prevent reentrancy without modifiers"
+    ),
+    _Q(
+        "What is the typical transaction fee on Solana?",
+        ("~$0.0005 (0.0005 SOL)", "~$50 (variable gas)"),
+        0,
+        "Solana has fixed, low fees around 0.0005 SOL (~$0.05)"
+    ),
+    _Q(
+        "How long does transaction finality take on Solana?",
+        ("~15 seconds", "~400ms"),
+        1,
+        "Solana achieves finality in ~400ms vs ~15 seconds on Ethereum"
+    ),
+    _Q(
+        "Which file contains the TypeScript SDK for frontend integration?",
+        ("app/sdk.ts", "tests/patent-nft.ts"),
+        0,
+        "app/sdk.ts (503 lines) contains all SDK classes for frontend integration"
+    ),
+    _Q(
+        "What command runs the Anchor test suite?",
+        ("npm test", "anchor test"),
+        1,
+        "anchor test builds, deploys to localnet, and runs tests"
+    ),
+    _Q(
+        "Where is the Anchor configuration stored?",
+        ("Anchor.toml", "anchor.config.js"),
+        0,
+        "Anchor.toml contains program IDs, cluster URLs, and build settings"
+    ),
+    _Q(
+        "What is the maximum supply of PSP tokens?",
+        ("1,000,000 PSP", "10,000,000 PSP"),
+        1,
+        "programs/psp-token/src/lib.rs sets max supply to 10 million PSP"
+    ),
+    _Q(
+        "Which Metaplex account type represents NFT ownership?",
+        ("Metadata Account", "Master Edition Account"),
+        1,
+        "Master Edition Account represents limited supply NFTs (supply = 0 for unique NFTs)"
+    ),
+    _Q(
+        "What happens if you try to mint the same patent twice?",
+        ("Second mint succeeds with new token", "Transaction fails - patent already exists"),
+        1,
+        "Patent registry PDA prevents duplicate minting - transaction fails if patent exists"
+    ),
+    _Q(
+        "How are program events emitted in Anchor?",
+        ("emit!(EventName { ... })", "event.emit(EventName { ... })"),
+        0,
+        "Anchor uses emit! macro to emit events to transaction logs"
+    ),
+    _Q(
+        "What is rent-exempt balance?",
+        ("Minimum balance to keep account alive", "Fee paid per transaction"),
+        0,
+        "Accounts must maintain minimum balance (rent-exempt) to avoid deletion"
+    ),
+    _Q(
+        "Which instruction can pause the PSP token program?",
+        ("programs/psp-token/src/lib.rs:pause()", "programs/psp-token/src/lib.rs:stop()"),
+        0,
+        "pause() instruction sets state.paused = true to disable critical functions"
+    ),
+    _Q(
+        "What is a Program Derived Address (PDA)?",
+        ("A user's wallet address", "A deterministic address derived from seeds"),
+        1,
+        "PDAs are deterministic addresses derived from seeds without private keys"
+    ),
+    _Q(
+        "Which program controls the escrow NFT during listing?",
+        ("The seller", "The listing PDA (marketplace program)"),
+        1,
+        "Listing PDA owns the escrow ATA, giving the program control over the NFT"
+    ),
+    _Q(
+        "What is Cross-Program Invocation (CPI)?",
+        ("Calling other programs from your program", "Calling frontend from program"),
+        0,
+        "CPI allows programs to call other programs (e.g., SPL Token, Metaplex)"
+    ),
+    _Q(
+        "How many programs are in the Solana project?",
+        ("2 programs", "4 programs"),
+        1,
+        "4 programs: patent-nft, psp-token, nft-marketplace, search-payment"
+    ),
+    _Q(
+        "What is the total lines of Rust code across all programs?",
+        ("~1,000 lines", "~1,808 lines"),
+        1,
+        "Total: 415 + 483 + 394 + 516 = 1,808 lines of Rust"
+    ),
+    _Q(
+        "Which file would you check to understand the complete minting flow?",
+        ("TEACHME.md - FLOW 1: Minting a Patent NFT", "README.md - Installation"),
+        0,
+        "TEACHME.md contains detailed execution flows showing all files and accounts involved"
+    ),
+)
+
 class SolanaProjectQuiz:
     def __init__(self):
-        self.questions = [
-            {
-                "question": "When minting a patent NFT, which file contains the Rust program logic?",
-                "options": ["programs/patent-nft/src/lib.rs", "app/sdk.ts"],
-                "correct": 0,
-                "explanation": "programs/patent-nft/src/lib.rs:52 (mint_patent_nft) contains the on-chain program logic"
-            },
-            {
-                "question": "What PDA seeds are used to derive the patent registry account?",
-                "options": ["[b'state']", "[b'patent', patent_hash]"],
-                "correct": 1,
-                "explanation": "Patent registry uses [b'patent', patent_hash] to ensure each patent can only be minted once"
-            },
-            {
-                "question": "Which SDK function prepares the minting transaction?",
-                "options": ["app/sdk.ts:147 (PatentNFTSDK.mintPatentNFT)", "app/sdk.ts:330 (NFTMarketplaceSDK.listNFT)"],
-                "correct": 0,
-                "explanation": "PatentNFTSDK.mintPatentNFT() derives PDAs and builds the minting transaction"
-            },
-            {
-                "question": "What is the minimum minting fee required?",
-                "options": ["0.025 SOL", "0.05 SOL"],
-                "correct": 1,
-                "explanation": "programs/patent-nft/src/lib.rs:53 verifies payment >= 0.05 SOL"
-            },
-            {
-                "question": "Which program is called via CPI to create NFT metadata?",
-                "options": ["SPL Token Program", "Metaplex Token Metadata Program"],
-                "correct": 1,
-                "explanation": "Metaplex Token Metadata Program is called to create NFT metadata and master edition"
-            },
-            {
-                "question": "When listing an NFT, where is the NFT transferred to?",
-                "options": ["Marketplace program account", "Escrow ATA owned by listing PDA"],
-                "correct": 1,
-                "explanation": "NFT is transferred to an Associated Token Account owned by the listing PDA for escrow"
-            },
-            {
-                "question": "What percentage marketplace fee is collected on sales?",
-                "options": ["2.5%", "5%"],
-                "correct": 0,
-                "explanation": "programs/nft-marketplace/src/lib.rs:102 calculates 2.5% platform fee"
-            },
-            {
-                "question": "Which instruction handles buying an NFT from the marketplace?",
-                "options": ["programs/nft-marketplace/src/lib.rs:97 (buy_nft)", "programs/nft-marketplace/src/lib.rs:52 (list_nft)"],
-                "correct": 0,
-                "explanation": "buy_nft() handles the purchase, fee distribution, and NFT transfer"
-            },
-            {
-                "question": "What is PSP in the Solana version?",
-                "options": ["An ERC-20 token", "An SPL Token"],
-                "correct": 1,
-                "explanation": "PSP (Patent Search Pennies) is an SPL Token on Solana, not ERC-20"
-            },
-            {
-                "question": "How many PSP tokens equal 1 SOL by default?",
-                "options": ["100 PSP", "1,000 PSP"],
-                "correct": 1,
-                "explanation": "Default exchange rate is 1 SOL = 1,000 PSP (configurable)"
-            },
-            {
-                "question": "Which program handles multi-token payment for searches?",
-                "options": ["programs/search-payment/src/lib.rs", "programs/psp-token/src/lib.rs"],
-                "correct": 0,
-                "explanation": "search-payment program supports SOL, USDC, and PSP payments"
-            },
-            {
-                "question": "What Anchor constraint verifies account ownership?",
-                "options": ["#[account(signer)]", "#[account(has_one = authority)]"],
-                "correct": 1,
-                "explanation": "has_one constraint verifies that an account field matches the expected value"
-            },
-            {
-                "question": "How does Solana prevent reentrancy attacks?",
-                "options": ["nonReentrant modifier", "Explicit account passing and Rust borrow checker"],
-                "correct": 1,
-                "explanation": "Solana's architecture and Rust's borrow checker prevent reentrancy without modifiers"
-            },
-            {
-                "question": "What is the typical transaction fee on Solana?",
-                "options": ["~$0.0005 (0.0005 SOL)", "~$50 (variable gas)"],
-                "correct": 0,
-                "explanation": "Solana has fixed, low fees around 0.0005 SOL (~$0.05)"
-            },
-            {
-                "question": "How long does transaction finality take on Solana?",
-                "options": ["~15 seconds", "~400ms"],
-                "correct": 1,
-                "explanation": "Solana achieves finality in ~400ms vs ~15 seconds on Ethereum"
-            },
-            {
-                "question": "Which file contains the TypeScript SDK for frontend integration?",
-                "options": ["app/sdk.ts", "tests/patent-nft.ts"],
-                "correct": 0,
-                "explanation": "app/sdk.ts (503 lines) contains all SDK classes for frontend integration"
-            },
-            {
-                "question": "What command runs the Anchor test suite?",
-                "options": ["npm test", "anchor test"],
-                "correct": 1,
-                "explanation": "anchor test builds, deploys to localnet, and runs tests"
-            },
-            {
-                "question": "Where is the Anchor configuration stored?",
-                "options": ["Anchor.toml", "anchor.config.js"],
-                "correct": 0,
-                "explanation": "Anchor.toml contains program IDs, cluster URLs, and build settings"
-            },
-            {
-                "question": "What is the maximum supply of PSP tokens?",
-                "options": ["1,000,000 PSP", "10,000,000 PSP"],
-                "correct": 1,
-                "explanation": "programs/psp-token/src/lib.rs sets max supply to 10 million PSP"
-            },
-            {
-                "question": "Which Metaplex account type represents NFT ownership?",
-                "options": ["Metadata Account", "Master Edition Account"],
-                "correct": 1,
-                "explanation": "Master Edition Account represents limited supply NFTs (supply = 0 for unique NFTs)"
-            },
-            {
-                "question": "What happens if you try to mint the same patent twice?",
-                "options": ["Second mint succeeds with new token", "Transaction fails - patent already exists"],
-                "correct": 1,
-                "explanation": "Patent registry PDA prevents duplicate minting - transaction fails if patent exists"
-            },
-            {
-                "question": "How are program events emitted in Anchor?",
-                "options": ["emit!(EventName { ... })", "event.emit(EventName { ... })"],
-                "correct": 0,
-                "explanation": "Anchor uses emit! macro to emit events to transaction logs"
-            },
-            {
-                "question": "What is rent-exempt balance?",
-                "options": ["Minimum balance to keep account alive", "Fee paid per transaction"],
-                "correct": 0,
-                "explanation": "Accounts must maintain minimum balance (rent-exempt) to avoid deletion"
-            },
-            {
-                "question": "Which instruction can pause the PSP token program?",
-                "options": ["programs/psp-token/src/lib.rs:pause()", "programs/psp-token/src/lib.rs:stop()"],
-                "correct": 0,
-                "explanation": "pause() instruction sets state.paused = true to disable critical functions"
-            },
-            {
-                "question": "What is a Program Derived Address (PDA)?",
-                "options": ["A user's wallet address", "A deterministic address derived from seeds"],
-                "correct": 1,
-                "explanation": "PDAs are deterministic addresses derived from seeds without private keys"
-            },
-            {
-                "question": "Which program controls the escrow NFT during listing?",
-                "options": ["The seller", "The listing PDA (marketplace program)"],
-                "correct": 1,
-                "explanation": "Listing PDA owns the escrow ATA, giving the program control over the NFT"
-            },
-            {
-                "question": "What is Cross-Program Invocation (CPI)?",
-                "options": ["Calling other programs from your program", "Calling frontend from program"],
-                "correct": 0,
-                "explanation": "CPI allows programs to call other programs (e.g., SPL Token, Metaplex)"
-            },
-            {
-                "question": "How many programs are in the Solana project?",
-                "options": ["2 programs", "4 programs"],
-                "correct": 1,
-                "explanation": "4 programs: patent-nft, psp-token, nft-marketplace, search-payment"
-            },
-            {
-                "question": "What is the total lines of Rust code across all programs?",
-                "options": ["~1,000 lines", "~1,808 lines"],
-                "correct": 1,
-                "explanation": "Total: 415 + 483 + 394 + 516 = 1,808 lines of Rust"
-            },
-            {
-                "question": "Which file would you check to understand the complete minting flow?",
-                "options": ["TEACHME.md - FLOW 1: Minting a Patent NFT", "README.md - Installation"],
-                "correct": 0,
-                "explanation": "TEACHME.md contains detailed execution flows showing all files and accounts involved"
-            },
-        ]
-        
+        self.questions = _QUESTIONS
         self.score = 0
         self.total_questions = 0
     
     def run_quiz(self, num_questions=10):
         """Run the quiz with specified number of questions"""
-        print("\n" + "="*70)
+        # Clamp once so the banner and counters show the actual count
+        n = min(num_questions, len(self.questions))
+
+        print("\n" + _BAR)
         print("🎓 SOLANA PATENT NFT MARKETPLACE QUIZ")
-        print("="*70)
-        print(f"\nYou will be asked {num_questions} random questions.")
+        print(_BAR)
+        print(f"\nYou will be asked {n} random questions.")
         print("This quiz tests your knowledge of:")
         print("  • Solana program architecture")
         print("  • Program Derived Addresses (PDAs)")
@@ -210,45 +223,39 @@ class SolanaProjectQuiz:
         print("\nGood luck!\n")
         
         # Randomly select questions
-        selected_questions = random.sample(self.questions, min(num_questions, len(self.questions)))
+        selected_questions = random.sample(self.questions, n)
         
         for i, q in enumerate(selected_questions, 1):
-            print(f"\n{'─'*70}")
-            print(f"Question {i}/{num_questions}:")
-            print(f"\n{q['question']}\n")
-            
-            # Shuffle options
-            options = list(enumerate(q['options']))
-            random.shuffle(options)
-            
-            # Find correct answer in shuffled options
-            correct_idx = next(idx for idx, (orig_idx, _) in enumerate(options) if orig_idx == q['correct'])
-            
-            # Display options
-            for idx, (_, option) in enumerate(options):
-                print(f"  {idx + 1}. {option}")
-            
+            # Shuffle options via an index permutation
+            perm = random.sample(range(len(q.options)), len(q.options))
+
+            # Render banner, question, and options in one write
+            buf = [f"\n{_HR}", f"Question {i}/{n}:", "", q.question, ""]
+            buf.extend(f"  {idx + 1}. {q.options[p]}" for idx, p in enumerate(perm))
+            sys.stdout.write("\n".join(buf) + "\n")
+            sys.stdout.flush()
+
             # Get user answer
             while True:
                 try:
-                    answer = input(f"\nYour answer (1-{len(options)}): ").strip()
+                    answer = input(f"\nYour answer (1-{len(perm)}): ").strip()
                     answer_idx = int(answer) - 1
-                    if 0 <= answer_idx < len(options):
+                    if 0 <= answer_idx < len(perm):
                         break
-                    print(f"Please enter a number between 1 and {len(options)}")
+                    print(f"Please enter a number between 1 and {len(perm)}")
                 except (ValueError, KeyboardInterrupt):
                     print("\nQuiz interrupted.")
                     return
-            
+
             # Check answer
             self.total_questions += 1
-            if answer_idx == correct_idx:
+            if perm[answer_idx] == q.correct:
                 self.score += 1
                 print("\n✅ Correct!")
             else:
-                print(f"\n❌ Incorrect. The correct answer was: {q['options'][q['correct']]}")
-            
-            print(f"\n💡 Explanation: {q['explanation']}")
+                print(f"\n❌ Incorrect. The correct answer was: {q.options[q.correct]}")
+
+            print(f"\n💡 Explanation: {q.explanation}")
         
         # Final score
         self.show_results()
@@ -257,27 +264,38 @@ class SolanaProjectQuiz:
         """Display final quiz results"""
         percentage = (self.score / self.total_questions * 100) if self.total_questions > 0 else 0
         
-        print("\n" + "="*70)
-        print("📊 QUIZ RESULTS")
-        print("="*70)
-        print(f"\nYou scored: {self.score}/{self.total_questions} ({percentage:.1f}%)\n")
-        
         if percentage >= 90:
-            print("🏆 Outstanding! You're a Solana expert!")
+            verdict = "🏆 Outstanding! You're a Solana expert!"
         elif percentage >= 75:
-            print("🎉 Great job! You have a solid understanding of Solana development.")
+            verdict = "🎉 Great job! You have a solid understanding of Solana development."
         elif percentage >= 60:
-            print("👍 Good work! Review TEACHME.md for areas to improve.")
+            verdict = "👍 Good work! Review TEACHME.md for areas to improve."
         else:
-            print("📚 Keep studying! Read TEACHME.md and try again.")
-        
-        print("\n" + "="*70)
-        print("\n📖 Resources:")
-        print("  • TEACHME.md - Detailed architecture and execution flows")
-        print("  • FAQ_SOLANA.md - 60 questions covering all aspects")
-        print("  • DEPLOYMENT.md - Deployment instructions")
-        print("  • MIGRATION_GUIDE.md - Ethereum to Solana migration")
-        print("\n")
+            verdict = "📚 Keep studying! Read TEACHME.md and try again."
+
+        # Render the whole results trailer in one write
+        buf = [
+            "",
+            _BAR,
+            "📊 QUIZ RESULTS",
+            _BAR,
+            "",
+            f"You scored: {self.score}/{self.total_questions} ({percentage:.1f}%)",
+            "",
+            verdict,
+            "",
+            _BAR,
+            "",
+            "📖 Resources:",
+            "  • TEACHME.md - Detailed architecture and execution flows",
+            "  • FAQ_SOLANA.md - 60 questions covering all aspects",
+            "  • DEPLOYMENT.md - Deployment instructions",
+            "  • MIGRATION_GUIDE.md - Ethereum to Solana migration",
+            "",
+            "",
+        ]
+        sys.stdout.write("\n".join(buf) + "\n")
+        sys.stdout.flush()
 
 def main():
     """Main entry point"""